@@ -1,28 +1,109 @@
 #!/usr/bin/env python3
 import argparse
 import asyncio
+import concurrent.futures
+import contextlib
 import curses
+import functools
 import json
 import os
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
 import time
 import urllib.request
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 import discord
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    import pulsectl
+except ImportError:  # optional; falls back to forking pactl
+    pulsectl = None
+
 DEFAULT_CONFIG_PATH = ".voice-config.json"
+PULSE_CACHE_TTL_SECONDS = 2.0
+# Proplist values in `pactl list` output can exceed asyncio's default 64 KiB line limit.
+PACTL_LINE_LIMIT = 1 << 20
+
+# argparse attribute -> .voice-config.json key
+CONFIG_ARG_KEYS = {
+    "guild_id": "guild_id",
+    "channel_id": "channel_id",
+    "user_id": "dm_user_id",
+}
+INTERACTIVE_AUDIO_DEFAULTS: dict[str, Any] = {
+    "mode": "connect",
+    "loop": False,
+    "noise_amp": 0.08,
+    "file": "rickroll.ogg",
+    "pulse_source": None,
+    "pulse_sink": None,
+}
+VOICE_POOL_IDLE_SECONDS = 60.0
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime: float) -> dict:
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
 
 
 def load_local_config(path: str) -> dict:
-    if not os.path.exists(path):
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
         return {}
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Keyed on mtime so edits to the file are picked up; copy so callers can't mutate the cache.
+    return dict(_load_config_cached(path, mtime))
+
+
+@functools.lru_cache(maxsize=1)
+def _supports_sixel() -> bool:
+    term = (os.environ.get("TERM") or "").lower()
+    return "sixel" in term or "xterm" in term or "mlterm" in term or "wezterm" in term
+
+
+class RecentTarget:
+    # Hand-written __slots__ rather than dataclass(slots=True), which needs Python 3.10.
+    __slots__ = ("kind", "label", "ts", "user_id", "guild_id", "channel_id", "menu_label")
+
+    def __init__(
+        self,
+        kind: str,
+        label: str,
+        ts: str = "",
+        user_id: Optional[int] = None,
+        guild_id: Optional[int] = None,
+        channel_id: Optional[int] = None,
+        menu_label: str = "",
+    ):
+        self.kind = kind
+        self.label = label
+        self.ts = ts
+        self.user_id = user_id
+        self.guild_id = guild_id
+        self.channel_id = channel_id
+        self.menu_label = menu_label
+
+    @property
+    def key(self) -> tuple:
+        return (self.kind, self.user_id, self.guild_id, self.channel_id)
 
 
 class VoiceSelfClient(discord.Client):
@@ -31,16 +112,55 @@ class VoiceSelfClient(discord.Client):
         self.args = args
         self._done = asyncio.Event()
         self._last_dave_status = "DAVE: not checked"
+        self._play_done: Optional[asyncio.Event] = None
+        self._dave_event = asyncio.Event()
+        self._dave_task: Optional[asyncio.Task] = None
+        self._dave_voice: Optional[discord.VoiceClient] = None
+        self._dave_deadline = 0.0
+        self._voice_pool: dict[int, tuple[discord.VoiceClient, asyncio.Task]] = {}
+        self._sorted_guilds_dirty = True
+        self._sorted_guilds_cache: tuple[discord.Guild, ...] = ()
+        self._sorted_channels: dict[int, tuple[discord.VoiceChannel, ...]] = {}
         self._debug_lines: list[str] = []
-        self._recent_targets: list[dict] = []
+        # Oldest first; newest entries are moved to the end.
+        self._recent_targets: OrderedDict[tuple, RecentTarget] = OrderedDict()
+        self._ts_cache: tuple[int, str] = (0, "")
+        self._recent_version = 0
+        self._recent_labels_cache: tuple[int, list[RecentTarget], list[str]] = (-1, [], [])
         self._log_file: Optional[str] = args.log_file
         self._speaking_activity: dict[int, float] = {}
         self._active_notice: Optional[dict[str, Any]] = None
         self._call_history: list[dict[str, Any]] = []
         self._active_call_records: dict[int, int] = {}
         self._ffmpeg_demuxers_cache: dict[str, set[str]] = {}
+        self._pulse_cache: dict[str, tuple[float, list[tuple[str, str]]]] = {}
+        self._pulse: Any = None
+        self._pulse_lock = asyncio.Lock()
+        self._chafa_path: Optional[str] = shutil.which("chafa")
+        self._ffmpeg_path: Optional[str] = None
+        self._file_stat_cache: Optional[tuple[str, os.stat_result]] = None
         self._last_connect_global: float = 0.0
         self._last_connect_target: dict[str, float] = {}
+        # head -> (needs_arg, usage, handler); a handler returns True to end the session.
+        self._session_cmds: dict[str, tuple[bool, str, Callable[..., Awaitable[bool]]]] = {
+            "help": (False, "help", self._cmd_help),
+            "?": (False, "help", self._cmd_help),
+            "status": (False, "status", self._cmd_status),
+            "dave": (False, "dave", self._cmd_dave),
+            "mode": (True, "mode <file|noise|mic|connect>", self._cmd_mode),
+            "file": (True, "file <path>", self._cmd_file),
+            "loop": (True, "loop <on|off>", self._cmd_loop),
+            "amp": (True, "amp <0..1>", self._cmd_amp),
+            "sources": (False, "sources", self._cmd_sources),
+            "sinks": (False, "sinks", self._cmd_sinks),
+            "source": (True, "source <pulse-source-name>", self._cmd_source),
+            "sink": (True, "sink <pulse-sink-name>", self._cmd_sink),
+            "restart": (False, "restart", self._cmd_restart),
+            "switch": (False, "switch", self._cmd_switch),
+            "leave": (False, "leave", self._cmd_leave),
+            "quit": (False, "quit", self._cmd_quit),
+            "exit": (False, "exit", self._cmd_quit),
+        }
         self._events: dict[str, list[float]] = {
             "connect": [],
             "ring": [],
@@ -48,6 +168,7 @@ class VoiceSelfClient(discord.Client):
         }
 
     async def on_ready(self):
+        self._invalidate_sorted_cache()
         try:
             if self.args.command == "list":
                 self._print_voice_channels()
@@ -64,6 +185,52 @@ class VoiceSelfClient(discord.Client):
         finally:
             self._done.set()
 
+    async def close(self) -> None:
+        self._drop_pulse_client()
+        await super().close()
+
+    async def on_guild_join(self, guild) -> None:
+        self._invalidate_sorted_cache(guild.id)
+
+    async def on_guild_remove(self, guild) -> None:
+        self._invalidate_sorted_cache(guild.id)
+
+    async def on_guild_update(self, before, after) -> None:
+        if before.name != after.name:
+            self._sorted_guilds_dirty = True
+
+    async def on_guild_channel_create(self, channel) -> None:
+        self._sorted_channels.pop(channel.guild.id, None)
+
+    async def on_guild_channel_delete(self, channel) -> None:
+        self._sorted_channels.pop(channel.guild.id, None)
+
+    async def on_guild_channel_update(self, before, after) -> None:
+        if before.position != after.position:
+            self._sorted_channels.pop(after.guild.id, None)
+
+    def _invalidate_sorted_cache(self, guild_id: Optional[int] = None) -> None:
+        self._sorted_guilds_dirty = True
+        if guild_id is None:
+            self._sorted_channels.clear()
+        else:
+            self._sorted_channels.pop(guild_id, None)
+
+    def _sorted_guilds(self) -> tuple[discord.Guild, ...]:
+        if self._sorted_guilds_dirty:
+            decorated = [(g.name.lower(), i, g) for i, g in enumerate(self.guilds)]
+            decorated.sort()
+            self._sorted_guilds_cache = tuple(g for _, _, g in decorated)
+            self._sorted_guilds_dirty = False
+        return self._sorted_guilds_cache
+
+    def _sorted_voice_channels(self, guild: discord.Guild) -> tuple[discord.VoiceChannel, ...]:
+        cached = self._sorted_channels.get(guild.id)
+        if cached is None:
+            cached = tuple(sorted(guild.voice_channels, key=lambda c: c.position))
+            self._sorted_channels[guild.id] = cached
+        return cached
+
     async def on_call_create(self, call) -> None:
         self._handle_call_event(call, "create")
 
@@ -201,65 +368,61 @@ class VoiceSelfClient(discord.Client):
 
     def _print_voice_channels(self) -> None:
         print(f"Logged in as: {self.user} ({self.user.id})")
-        for guild in sorted(self.guilds, key=lambda g: g.name.lower()):
+        for guild in self._sorted_guilds():
             print(f"Guild: {guild.name} ({guild.id})")
             if not guild.voice_channels:
                 print("  - no voice channels")
                 continue
-            for ch in sorted(guild.voice_channels, key=lambda c: c.position):
+            for ch in self._sorted_voice_channels(guild):
                 members = len(ch.members)
                 print(f"  - {ch.name} (channel_id={ch.id}, members={members})")
 
     async def _play_audio(self) -> None:
-        self._enforce_connect_safety(f"guild:{self.args.guild_id}:{self.args.channel_id}")
-        guild = self.get_guild(self.args.guild_id)
+        args = self.args
+        self._enforce_connect_safety(f"guild:{args.guild_id}:{args.channel_id}")
+        guild = self.get_guild(args.guild_id)
         if guild is None:
-            raise RuntimeError(f"Guild not found: {self.args.guild_id}")
+            raise RuntimeError(f"Guild not found: {args.guild_id}")
 
-        channel = guild.get_channel(self.args.channel_id)
-        if channel is None or not isinstance(channel, discord.VoiceChannel):
-            raise RuntimeError(f"Voice channel not found: {self.args.channel_id}")
+        channel = guild.get_channel(args.channel_id)
+        if getattr(channel, "type", None) is not discord.ChannelType.voice:
+            raise RuntimeError(f"Voice channel not found: {args.channel_id}")
 
         print(f"Connecting to {guild.name}/{channel.name}...")
         voice = await channel.connect(reconnect=True, self_deaf=False, self_mute=False)
-        if self.args.dave_debug or self.args.require_dave:
-            await self._wait_for_dave_status(voice, timeout=self.args.dave_wait_timeout)
-        if self.args.require_dave:
-            self._enforce_dave_or_raise(voice)
-        if self.args.mode == "connect":
+        await self._after_connect_dave_checks(voice)
+        if args.mode == "connect":
             await self._hold_connection(voice, f"{guild.name}/{channel.name}")
         else:
             await self._play_to_voice_client(voice, f"{guild.name}/{channel.name}")
 
     async def _play_dm_audio(self) -> None:
-        self._enforce_connect_safety(f"dm:{self.args.user_id}")
-        user = self.get_user(self.args.user_id)
+        args = self.args
+        self._enforce_connect_safety(f"dm:{args.user_id}")
+        user = self.get_user(args.user_id)
         if user is None:
             self._enforce_fetch_user_safety()
-            user = await self.fetch_user(self.args.user_id)
+            user = await self.fetch_user(args.user_id)
         if user is None:
-            raise RuntimeError(f"User not found: {self.args.user_id}")
+            raise RuntimeError(f"User not found: {args.user_id}")
 
         dm = user.dm_channel or await user.create_dm()
         if dm is None:
-            raise RuntimeError(f"Could not open DM channel with user {self.args.user_id}")
+            raise RuntimeError(f"Could not open DM channel with user {args.user_id}")
 
-        print(f"Connecting to DM call with {user} (ring={self.args.ring})...")
-        if self.args.ring:
+        print(f"Connecting to DM call with {user} (ring={args.ring})...")
+        if args.ring:
             self._enforce_ring_safety()
-        voice = await dm.connect(reconnect=True, ring=self.args.ring)
-        if self.args.dave_debug or self.args.require_dave:
-            await self._wait_for_dave_status(voice, timeout=self.args.dave_wait_timeout)
-        if self.args.require_dave:
-            self._enforce_dave_or_raise(voice)
-        if self.args.mode == "connect":
+        voice = await dm.connect(reconnect=True, ring=args.ring)
+        await self._after_connect_dave_checks(voice)
+        if args.mode == "connect":
             await self._hold_connection(voice, f"DM:{user}")
         else:
             await self._play_to_voice_client(voice, f"DM:{user}")
 
     async def _run_tui(self) -> None:
         print(f"Logged in as: {self.user} ({self.user.id})")
-        self._tui_configure_audio()
+        await self._tui_configure_audio()
         while True:
             root = self._select_menu("Choose target type", ["DM", "Guild", "Quit"])
             if root == 2:
@@ -323,14 +486,17 @@ class VoiceSelfClient(discord.Client):
         def run(coro):
             return asyncio.run_coroutine_threadsafe(coro, loop).result()
 
+        def connect(coro):
+            return self._curses_connect(stdscr, loop, coro)
+
         while True:
             if not startup_done:
                 startup_done = True
                 try:
                     if getattr(self.args, "start_dm_user_id", None):
-                        voice, label = run(self._open_dm_connection_by_id(int(self.args.start_dm_user_id)))
+                        voice, label = connect(self._open_dm_connection_by_id(int(self.args.start_dm_user_id)))
                     elif getattr(self.args, "start_guild_id", None) and getattr(self.args, "start_channel_id", None):
-                        voice, label = run(
+                        voice, label = connect(
                             self._open_guild_connection(int(self.args.start_guild_id), int(self.args.start_channel_id))
                         )
                 except Exception as e:
@@ -373,7 +539,7 @@ class VoiceSelfClient(discord.Client):
                         raw = self._curses_prompt(stdscr, "User ID")
                         if raw.isdigit():
                             try:
-                                voice, label = run(self._open_dm_connection_by_id(int(raw)))
+                                voice, label = connect(self._open_dm_connection_by_id(int(raw)))
                             except Exception as e:
                                 self._curses_message(stdscr, f"Error: {e}")
                     elif target == 1:
@@ -403,7 +569,7 @@ class VoiceSelfClient(discord.Client):
                                 self._curses_message(stdscr, "DM has no recipient id.")
                             else:
                                 try:
-                                    voice, label = run(self._open_dm_connection_by_id(uid))
+                                    voice, label = connect(self._open_dm_connection_by_id(uid))
                                 except Exception as e:
                                     self._curses_message(stdscr, f"Error: {e}")
                     elif target == 2:
@@ -415,11 +581,11 @@ class VoiceSelfClient(discord.Client):
                         c = self._curses_prompt(stdscr, "Channel ID")
                         if g.isdigit() and c.isdigit():
                             try:
-                                voice, label = run(self._open_guild_connection(int(g), int(c)))
+                                voice, label = connect(self._open_guild_connection(int(g), int(c)))
                             except Exception as e:
                                 self._curses_message(stdscr, f"Error: {e}")
                     elif target == 1:
-                        guilds = sorted(self.guilds, key=lambda gg: gg.name.lower())
+                        guilds = self._sorted_guilds()
                         if not guilds:
                             self._curses_message(stdscr, "No guilds found.")
                             continue
@@ -438,7 +604,7 @@ class VoiceSelfClient(discord.Client):
                         )
                         if gpick < len(guilds):
                             guild = guilds[gpick]
-                            chans = sorted(guild.voice_channels, key=lambda cc: cc.position)
+                            chans = self._sorted_voice_channels(guild)
                             if not chans:
                                 self._curses_message(stdscr, "Selected guild has no voice channels.")
                                 continue
@@ -453,7 +619,7 @@ class VoiceSelfClient(discord.Client):
                             if cpick < len(chans):
                                 ch = chans[cpick]
                                 try:
-                                    voice, label = run(self._open_guild_connection(guild.id, ch.id))
+                                    voice, label = connect(self._open_guild_connection(guild.id, ch.id))
                                 except Exception as e:
                                     self._curses_message(stdscr, f"Error: {e}")
                 elif choice == 4:
@@ -469,10 +635,14 @@ class VoiceSelfClient(discord.Client):
                     if conn is not None:
                         voice, label = conn
                 elif choice == 7:
-                    self._ctui_audio_settings(stdscr)
+                    self._ctui_audio_settings(stdscr, loop)
                 elif choice == 8:
                     self._ctui_show_missed_calls(stdscr)
                 else:
+                    try:
+                        run(self._take_pooled_voice(None))
+                    except Exception:
+                        pass
                     return
             else:
                 choice = self._curses_menu(
@@ -488,7 +658,7 @@ class VoiceSelfClient(discord.Client):
                         "Show call log",
                         "Join/Accept DM Call",
                         "Quick Jump (Ctrl+K)",
-                        "Switch target (disconnect)",
+                        f"Switch target (stay in channel up to {int(VOICE_POOL_IDLE_SECONDS)}s)",
                         "Disconnect",
                         "Quit",
                     ],
@@ -515,7 +685,7 @@ class VoiceSelfClient(discord.Client):
                     except Exception as e:
                         self._curses_message(stdscr, f"Error: {e}")
                 elif choice == 2:
-                    self._ctui_audio_settings(stdscr)
+                    self._ctui_audio_settings(stdscr, loop)
                 elif choice == 3:
                     try:
                         run(self._wait_for_dave_status(voice, timeout=max(0.5, self.args.dave_wait_timeout)))
@@ -548,7 +718,14 @@ class VoiceSelfClient(discord.Client):
                     conn = self._ctui_quick_jump(stdscr, loop)
                     if conn is not None:
                         voice, label = conn
-                elif choice in (9, 10):
+                elif choice == 9:
+                    try:
+                        run(self._park_voice(voice))
+                    except Exception:
+                        pass
+                    voice = None
+                    label = ""
+                elif choice == 10:
                     try:
                         run(self._disconnect_voice(voice))
                     except Exception:
@@ -558,6 +735,7 @@ class VoiceSelfClient(discord.Client):
                 else:
                     try:
                         run(self._disconnect_voice(voice))
+                        run(self._take_pooled_voice(None))
                     except Exception:
                         pass
                     return
@@ -583,7 +761,9 @@ class VoiceSelfClient(discord.Client):
             lines += [
                 "Connected view:",
                 "  Restart/Apply audio mode to reapply file/noise/mic settings",
-                "  Switch target disconnects first, then opens target picker",
+                f"  Switch target keeps you in the channel (visible) for up to {int(VOICE_POOL_IDLE_SECONDS)}s;",
+                "    a same-guild pick moves it, anything else drops it",
+                "  Disconnect leaves the channel immediately",
             ]
         else:
             lines += [
@@ -592,7 +772,10 @@ class VoiceSelfClient(discord.Client):
             ]
         self._curses_message(stdscr, "\n".join(lines))
 
-    def _ctui_audio_settings(self, stdscr) -> None:
+    def _ctui_audio_settings(self, stdscr, loop: asyncio.AbstractEventLoop) -> None:
+        def run(coro):
+            return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
         mode = self._curses_menu(stdscr, "Audio mode", ["File", "Noise", "Microphone", "Connect only", "Back"])
         if mode == 0:
             self.args.mode = "file"
@@ -611,7 +794,7 @@ class VoiceSelfClient(discord.Client):
             self.args.loop = False
         elif mode == 2:
             self.args.mode = "mic"
-            source_entries = self._pulse_device_entries("sources")
+            source_entries = run(self._pulse_device_entries("sources"))
             source_labels = [f"{desc} [{name}]" for name, desc in source_entries]
             if source_entries:
                 idx = self._curses_menu(stdscr, "Select Pulse source", source_labels + ["Manual", "Back"])
@@ -630,21 +813,21 @@ class VoiceSelfClient(discord.Client):
             self.args.mode = "connect"
             self.args.loop = False
 
-        sink_entries = self._pulse_device_entries("sinks")
+        sink_entries = run(self._pulse_device_entries("sinks"))
         sink_labels = [f"{desc} [{name}]" for name, desc in sink_entries]
         if sink_entries:
             idx = self._curses_menu(stdscr, "Output sink", ["Keep current"] + sink_labels + ["Manual"])
             if idx >= 1 and idx <= len(sink_entries):
                 self.args.pulse_sink = sink_entries[idx - 1][0]
-                self._set_default_pulse_device("sink", self.args.pulse_sink)
+                run(self._set_default_pulse_device("sink", self.args.pulse_sink))
             elif idx == len(sink_entries) + 1:
                 manual = self._curses_prompt(stdscr, "Pulse sink name")
                 if manual:
                     self.args.pulse_sink = manual
-                    self._set_default_pulse_device("sink", self.args.pulse_sink)
+                    run(self._set_default_pulse_device("sink", self.args.pulse_sink))
 
         if self.args.mode == "mic" and self.args.pulse_source:
-            self._set_default_pulse_device("source", self.args.pulse_source)
+            run(self._set_default_pulse_device("source", self.args.pulse_source))
 
     def _curses_menu(
         self,
@@ -678,12 +861,11 @@ class VoiceSelfClient(discord.Client):
                     self._safe_addstr(stdscr, header_start + i, 0, line)
                 header_start += len(dm_lines)
             if title.startswith("Connected:"):
-                status = self._collect_voice_status(voice)
-                self._curses_add_wrapped(stdscr, header_start + 0, 0, status)
-                self._curses_add_wrapped(stdscr, header_start + 1, 0, self._last_dave_status)
-                self._curses_add_wrapped(stdscr, header_start + 2, 0, self._collect_audio_status())
+                status_y = header_start
+                self._curses_draw_connected_header(stdscr, status_y, voice)
                 base = header_start + 5
             else:
+                status_y = -1
                 base = header_start + 2
             self._safe_addstr(stdscr, base - 1, 0, f"Search: {query}")
             render_items = [items[i] for i in filtered] if filtered else ["(no results)"]
@@ -706,8 +888,15 @@ class VoiceSelfClient(discord.Client):
                 for row, line in enumerate(call_lines, start=end_row + 1):
                     self._safe_addstr(stdscr, row, 0, line)
             stdscr.refresh()
-            stdscr.timeout(max(50, int(refresh_ms)))
+            # Poll input in short ticks so the status header stays live between full redraws.
+            stdscr.timeout(100)
+            next_full = time.monotonic() + max(50, int(refresh_ms)) / 1000.0
             ch = stdscr.getch()
+            while ch == -1 and time.monotonic() < next_full:
+                if status_y >= 0 and voice is not None and voice.is_connected():
+                    self._curses_draw_connected_header(stdscr, status_y, voice, clear=True)
+                    stdscr.refresh()
+                ch = stdscr.getch()
             if ch == -1:
                 continue
             if ch in (curses.KEY_UP, ord("k")):
@@ -741,6 +930,20 @@ class VoiceSelfClient(discord.Client):
             elif 32 <= ch <= 126:
                 query += chr(ch)
 
+    def _curses_draw_connected_header(
+        self, stdscr, y: int, voice: Optional[discord.VoiceClient], *, clear: bool = False
+    ) -> None:
+        if clear:
+            for row in range(y, y + 4):
+                try:
+                    stdscr.move(row, 0)
+                    stdscr.clrtoeol()
+                except curses.error:
+                    break
+        self._curses_add_wrapped(stdscr, y + 0, 0, self._collect_voice_status(voice))
+        self._curses_add_wrapped(stdscr, y + 1, 0, self._last_dave_status)
+        self._curses_add_wrapped(stdscr, y + 2, 0, self._collect_audio_status())
+
     def _curses_add_wrapped(self, stdscr, y: int, x: int, text: str) -> None:
         max_y, max_x = stdscr.getmaxyx()
         if y >= max_y:
@@ -776,6 +979,31 @@ class VoiceSelfClient(discord.Client):
         curses.noecho()
         return data
 
+    def _curses_message_nonblock(self, stdscr, msg: str) -> None:
+        stdscr.erase()
+        max_y, _ = stdscr.getmaxyx()
+        self._curses_add_wrapped(stdscr, 0, 0, msg)
+        self._safe_addstr(stdscr, max(0, max_y - 2), 0, "Esc to cancel")
+        stdscr.refresh()
+
+    def _curses_connect(self, stdscr, loop: asyncio.AbstractEventLoop, coro):
+        # Poll the connect future so the UI stays responsive and Esc can abort a stalled handshake.
+        fut = asyncio.run_coroutine_threadsafe(coro, loop)
+        stdscr.timeout(0)
+        try:
+            while True:
+                try:
+                    return fut.result(timeout=0.25)
+                except concurrent.futures.TimeoutError:
+                    self._curses_message_nonblock(stdscr, "Connecting...")
+                    if stdscr.getch() == 27:
+                        if not fut.cancel():
+                            # Connect finished as Esc was pressed; keep the live client.
+                            return fut.result()
+                        raise RuntimeError("Connect cancelled.")
+        finally:
+            stdscr.timeout(-1)
+
     def _curses_message(self, stdscr, msg: str) -> None:
         stdscr.timeout(-1)
         stdscr.clear()
@@ -825,11 +1053,13 @@ class VoiceSelfClient(discord.Client):
         self._show_sixel_from_url(stdscr, str(user.display_avatar.url), f"User Avatar: {user}")
 
     def _ctui_show_voice_members(self, stdscr, channel: discord.VoiceChannel) -> None:
-        members = sorted(channel.members, key=lambda m: str(m).lower())
-        if not members:
+        decorated = [(str(m), m) for m in channel.members]
+        if not decorated:
             self._curses_message(stdscr, f"No users in {channel.name}.")
             return
-        labels = [f"{m} ({m.id})" for m in members]
+        decorated.sort(key=lambda x: x[0].lower())
+        members = [m for _, m in decorated]
+        labels = [f"{name} ({m.id})" for name, m in decorated]
         self._curses_menu(
             stdscr,
             f"Users in {channel.name} (search, p=avatar)",
@@ -837,17 +1067,25 @@ class VoiceSelfClient(discord.Client):
             preview_callback=lambda i: self._ctui_preview_user(stdscr, members[i]) if i < len(members) else None,
         )
 
-    def _ctui_find_user_in_voice(self, stdscr, loop: asyncio.AbstractEventLoop):
+    async def _collect_voice_member_entries(self) -> tuple[list[tuple], list[str]]:
         entries = []
-        for guild in sorted(self.guilds, key=lambda g: g.name.lower()):
-            for ch in sorted(guild.voice_channels, key=lambda c: c.position):
+        labels: list[str] = []
+        for guild in self._sorted_guilds():
+            for ch in self._sorted_voice_channels(guild):
+                prefix = f"{guild.name}/{ch.name}"
                 for m in ch.members:
                     entries.append((m, guild, ch))
+                    labels.append(f"{m} ({m.id}) -> {prefix}")
+                    if len(entries) % 500 == 0:
+                        await asyncio.sleep(0)
+        return entries, labels
+
+    def _ctui_find_user_in_voice(self, stdscr, loop: asyncio.AbstractEventLoop):
+        entries, labels = asyncio.run_coroutine_threadsafe(self._collect_voice_member_entries(), loop).result()
         if not entries:
             self._curses_message(stdscr, "No users currently in voice channels.")
             return None
 
-        labels = [f"{m} ({m.id}) -> {g.name}/{ch.name}" for m, g, ch in entries]
         idx = self._curses_menu(
             stdscr,
             "Find user in voice (type name/id, p=avatar)",
@@ -865,9 +1103,7 @@ class VoiceSelfClient(discord.Client):
         )
         if action == 0:
             try:
-                voice, label = asyncio.run_coroutine_threadsafe(
-                    self._open_guild_connection(guild.id, channel.id), loop
-                ).result()
+                voice, label = self._curses_connect(stdscr, loop, self._open_guild_connection(guild.id, channel.id))
             except Exception as e:
                 self._curses_message(stdscr, f"Error: {e}")
                 return None
@@ -878,10 +1114,10 @@ class VoiceSelfClient(discord.Client):
         if not self.args.sixel:
             self._curses_message(stdscr, "SIXEL preview is disabled. Run ctui with --sixel.")
             return
-        if not self._supports_sixel():
+        if not _supports_sixel():
             self._curses_message(stdscr, "Terminal SIXEL support not detected.")
             return
-        if shutil.which("chafa") is None:
+        if self._chafa_path is None:
             self._curses_message(stdscr, "chafa not found. Install chafa for SIXEL image preview.")
             return
         tmp_path = None
@@ -913,7 +1149,7 @@ class VoiceSelfClient(discord.Client):
                 tmp_path = tmp.name
             curses.endwin()
             print(f"\n{title}\n")
-            subprocess.run(["chafa", "-f", "sixel", tmp_path], check=False)
+            subprocess.run([self._chafa_path, "-f", "sixel", tmp_path], check=False)
             input("\nPress Enter to return to CTUI...")
         except Exception as e:
             self._curses_message(stdscr, f"SIXEL preview failed: {e}")
@@ -924,21 +1160,22 @@ class VoiceSelfClient(discord.Client):
             except Exception:
                 pass
 
-    def _supports_sixel(self) -> bool:
-        term = (os.environ.get("TERM") or "").lower()
-        return "sixel" in term or "xterm" in term or "mlterm" in term or "wezterm" in term
-
     def _curses_show_debug_log(self, stdscr) -> None:
         lines = self._debug_lines[-100:] if self._debug_lines else ["(no debug lines yet)"]
         pos = max(0, len(lines) - 1)
+        last_max_x = -1
+        clipped: list[str] = []
         while True:
             stdscr.clear()
             self._safe_addstr(stdscr, 0, 0, "Debug log (j/k scroll, q exit)")
             max_y, max_x = stdscr.getmaxyx()
+            if max_x != last_max_x:
+                clipped = [line[: max_x - 1] for line in lines]
+                last_max_x = max_x
             view_h = max(1, max_y - 2)
             start = max(0, min(pos - view_h + 1, len(lines) - view_h))
-            for row, line in enumerate(lines[start : start + view_h], start=1):
-                self._safe_addstr(stdscr, row, 0, line[: max_x - 1])
+            for row in range(start, min(len(clipped), start + view_h)):
+                self._safe_addstr(stdscr, row - start + 1, 0, clipped[row])
             stdscr.refresh()
             ch = stdscr.getch()
             if ch in (ord("q"), 27):
@@ -1237,16 +1474,15 @@ class VoiceSelfClient(discord.Client):
         print(f"Connecting to DM call with {user} (ring={self.args.ring})...")
         if self.args.ring:
             self._enforce_ring_safety()
-        voice = await dm.connect(reconnect=True, ring=self.args.ring)
+        await self._take_pooled_voice(None)
+        try:
+            voice = await dm.connect(reconnect=True, ring=self.args.ring)
+        except asyncio.CancelledError:
+            await self._drop_voice_client(dm)
+            raise
         self._attach_voice_ws_hook(voice)
         await self._after_connect_dave_checks(voice)
-        self._remember_recent(
-            {
-                "kind": "dm",
-                "user_id": user.id,
-                "label": f"DM:{user} ({user.id})",
-            }
-        )
+        self._remember_recent(RecentTarget(kind="dm", label=f"DM:{user} ({user.id})", user_id=user.id))
         return voice, f"DM:{user}"
         await self._handle_connected_voice(voice, label)
 
@@ -1255,13 +1491,16 @@ class VoiceSelfClient(discord.Client):
         if not dm_channels:
             print("No DM channels found.")
             return
-        dm_channels = sorted(dm_channels, key=lambda c: str(c.recipient).lower() if c.recipient else "")
-        labels = []
-        for ch in dm_channels:
+        decorated = []
+        for i, ch in enumerate(dm_channels):
             if ch.recipient:
-                labels.append(f"{ch.recipient} (user_id={ch.recipient.id})")
+                name = str(ch.recipient)
+                decorated.append((name.lower(), i, ch, f"{name} (user_id={ch.recipient.id})"))
             else:
-                labels.append(f"Unknown recipient (channel_id={ch.id})")
+                decorated.append(("", i, ch, f"Unknown recipient (channel_id={ch.id})"))
+        decorated.sort()
+        dm_channels = [ch for _, _, ch, _ in decorated]
+        labels = [label for _, _, _, label in decorated]
         idx = self._select_menu("Select DM", labels + ["Back"])
         if idx == len(labels):
             return
@@ -1286,38 +1525,66 @@ class VoiceSelfClient(discord.Client):
         if guild is None:
             raise RuntimeError(f"Guild not found: {guild_id}")
         channel = guild.get_channel(channel_id)
-        if channel is None or not isinstance(channel, discord.VoiceChannel):
+        if getattr(channel, "type", None) is not discord.ChannelType.voice:
             raise RuntimeError(f"Voice channel not found: {channel_id}")
-        print(f"Connecting to {guild.name}/{channel.name}...")
-        voice = await channel.connect(reconnect=True, self_deaf=False, self_mute=False)
+        pooled = await self._take_pooled_voice(guild.id)
+        if pooled is not None:
+            print(f"Moving to {guild.name}/{channel.name}...")
+            try:
+                await pooled.move_to(channel)
+            except BaseException:
+                # Already taken out of the pool, so nothing else would ever disconnect it.
+                await self._drop_voice_client(channel)
+                raise
+            voice = pooled
+            self._dave_voice = None
+        else:
+            print(f"Connecting to {guild.name}/{channel.name}...")
+            try:
+                voice = await channel.connect(reconnect=True, self_deaf=False, self_mute=False)
+            except asyncio.CancelledError:
+                await self._drop_voice_client(channel)
+                raise
         self._attach_voice_ws_hook(voice)
         await self._after_connect_dave_checks(voice)
         self._remember_recent(
-            {
-                "kind": "guild",
-                "guild_id": guild.id,
-                "channel_id": channel.id,
-                "label": f"{guild.name}/{channel.name} ({guild.id}/{channel.id})",
-            }
+            RecentTarget(
+                kind="guild",
+                label=f"{guild.name}/{channel.name} ({guild.id}/{channel.id})",
+                guild_id=guild.id,
+                channel_id=channel.id,
+            )
         )
         return voice, f"{guild.name}/{channel.name}"
 
-    def _remember_recent(self, entry: dict) -> None:
-        entry = dict(entry)
-        entry["ts"] = datetime.now().isoformat(timespec="seconds")
-        self._recent_targets = [
-            e
-            for e in self._recent_targets
-            if not (
-                e.get("kind") == entry.get("kind")
-                and e.get("user_id") == entry.get("user_id")
-                and e.get("guild_id") == entry.get("guild_id")
-                and e.get("channel_id") == entry.get("channel_id")
-            )
-        ]
-        self._recent_targets.insert(0, entry)
-        self._recent_targets = self._recent_targets[:30]
-        self._dbg(f"recent add: {entry.get('label')}")
+    async def _drop_voice_client(self, channel) -> None:
+        # discord.py only tears down a half-open connect on TimeoutError; a cancelled one stays
+        # registered, and every later connect to that guild/DM fails with "Already connected".
+        try:
+            key_id, _ = channel._get_voice_client_key()
+            voice = self._connection._get_voice_client(key_id)
+        except Exception:
+            return
+        if voice is None:
+            return
+        try:
+            await voice.disconnect(force=True)
+        except Exception as e:
+            self._dbg(f"voice cleanup failed: {e!r}")
+
+    def _remember_recent(self, entry: RecentTarget) -> None:
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now)))
+        entry.ts = self._ts_cache[1]
+        entry.menu_label = f"[{entry.ts}] {entry.label}"
+        key = entry.key
+        self._recent_targets.pop(key, None)
+        self._recent_targets[key] = entry
+        if len(self._recent_targets) > 30:
+            self._recent_targets.popitem(last=False)
+        self._recent_version += 1
+        self._dbg(f"recent add: {entry.label}")
 
     def _attach_voice_ws_hook(self, voice: discord.VoiceClient) -> None:
         conn = getattr(voice, "_connection", None)
@@ -1345,6 +1612,7 @@ class VoiceSelfClient(discord.Client):
                 raw_uid = data.get("user_id")
                 if raw_uid is not None:
                     self._speaking_activity.pop(int(raw_uid), None)
+            self._check_dave_ready()
         except Exception as e:
             self._dbg(f"voice ws hook error: {e!r}")
 
@@ -1352,20 +1620,22 @@ class VoiceSelfClient(discord.Client):
         if not self._recent_targets:
             self._curses_message(stdscr, "No recent targets yet.")
             return None
-        labels = [f"[{e.get('ts')}] {e.get('label')}" for e in self._recent_targets]
+        ver, recent, labels = self._recent_labels_cache
+        if ver != self._recent_version:
+            recent = list(reversed(self._recent_targets.values()))
+            labels = [e.menu_label for e in recent]
+            self._recent_labels_cache = (self._recent_version, recent, labels)
         idx = self._curses_menu(stdscr, "Recent targets (type to search)", labels + ["Back"])
-        if idx >= len(self._recent_targets):
+        if idx >= len(recent):
             return None
-        entry = self._recent_targets[idx]
+        entry = recent[idx]
         try:
-            if entry.get("kind") == "dm":
-                return asyncio.run_coroutine_threadsafe(
-                    self._open_dm_connection_by_id(int(entry["user_id"])), loop
-                ).result()
-            if entry.get("kind") == "guild":
-                return asyncio.run_coroutine_threadsafe(
-                    self._open_guild_connection(int(entry["guild_id"]), int(entry["channel_id"])), loop
-                ).result()
+            if entry.kind == "dm":
+                return self._curses_connect(stdscr, loop, self._open_dm_connection_by_id(int(entry.user_id)))
+            if entry.kind == "guild":
+                return self._curses_connect(
+                    stdscr, loop, self._open_guild_connection(int(entry.guild_id), int(entry.channel_id))
+                )
         except Exception as e:
             self._curses_message(stdscr, f"Error: {e}")
             return None
@@ -1374,11 +1644,20 @@ class VoiceSelfClient(discord.Client):
 
     def _ctui_quick_jump(self, stdscr, loop: asyncio.AbstractEventLoop):
         targets: list[dict] = []
-        for e in self._recent_targets:
-            targets.append(dict(e, recent=True))
+        for e in reversed(self._recent_targets.values()):
+            targets.append(
+                {
+                    "kind": e.kind,
+                    "user_id": e.user_id,
+                    "guild_id": e.guild_id,
+                    "channel_id": e.channel_id,
+                    "label": e.label,
+                    "recent": True,
+                }
+            )
 
-        for guild in sorted(self.guilds, key=lambda g: g.name.lower()):
-            for ch in sorted(guild.voice_channels, key=lambda c: c.position):
+        for guild in self._sorted_guilds():
+            for ch in self._sorted_voice_channels(guild):
                 targets.append(
                     {
                         "kind": "guild",
@@ -1424,13 +1703,11 @@ class VoiceSelfClient(discord.Client):
         t = targets[idx]
         try:
             if t.get("kind") == "dm":
-                return asyncio.run_coroutine_threadsafe(
-                    self._open_dm_connection_by_id(int(t["user_id"])), loop
-                ).result()
+                return self._curses_connect(stdscr, loop, self._open_dm_connection_by_id(int(t["user_id"])))
             if t.get("kind") == "guild":
-                return asyncio.run_coroutine_threadsafe(
-                    self._open_guild_connection(int(t["guild_id"]), int(t["channel_id"])), loop
-                ).result()
+                return self._curses_connect(
+                    stdscr, loop, self._open_guild_connection(int(t["guild_id"]), int(t["channel_id"]))
+                )
         except Exception as e:
             self._curses_message(stdscr, f"Error: {e}")
             return None
@@ -1478,13 +1755,13 @@ class VoiceSelfClient(discord.Client):
             self._curses_message(stdscr, "Selected DM has no recipient id.")
             return None
         try:
-            return asyncio.run_coroutine_threadsafe(self._open_dm_connection_by_id(int(uid)), loop).result()
+            return self._curses_connect(stdscr, loop, self._open_dm_connection_by_id(int(uid)))
         except Exception as e:
             self._curses_message(stdscr, f"Error: {e}")
             return None
 
     async def _connect_guild_from_list(self) -> None:
-        guilds = sorted(self.guilds, key=lambda g: g.name.lower())
+        guilds = self._sorted_guilds()
         if not guilds:
             print("No guilds found.")
             return
@@ -1492,7 +1769,7 @@ class VoiceSelfClient(discord.Client):
         if g_idx == len(guilds):
             return
         guild = guilds[g_idx]
-        channels = sorted(guild.voice_channels, key=lambda c: c.position)
+        channels = self._sorted_voice_channels(guild)
         if not channels:
             print("Selected guild has no voice channels.")
             return
@@ -1509,9 +1786,10 @@ class VoiceSelfClient(discord.Client):
         await self._handle_connected_voice(voice, f"{guild.name}/{channel.name}")
 
     async def _after_connect_dave_checks(self, voice: discord.VoiceClient) -> None:
-        if self.args.dave_debug or self.args.require_dave:
-            await self._wait_for_dave_status(voice, timeout=self.args.dave_wait_timeout)
-        if self.args.require_dave:
+        args = self.args
+        if args.dave_debug or args.require_dave:
+            await self._wait_for_dave_status(voice, timeout=args.dave_wait_timeout)
+        if args.require_dave:
             self._enforce_dave_or_raise(voice)
 
     async def _disconnect_voice(self, voice: discord.VoiceClient) -> None:
@@ -1519,15 +1797,76 @@ class VoiceSelfClient(discord.Client):
             voice.stop()
         await voice.disconnect(force=True)
 
+    async def _park_voice(self, voice: discord.VoiceClient) -> None:
+        guild = getattr(voice.channel, "guild", None)
+        if guild is None or not voice.is_connected():
+            await self._disconnect_voice(voice)
+            return
+        if voice.is_playing():
+            voice.stop()
+        old = self._voice_pool.pop(guild.id, None)
+        if old is not None:
+            old[1].cancel()
+            if old[0] is not voice:
+                await self._disconnect_voice(old[0])
+        expiry = asyncio.create_task(self._expire_pooled_voice(guild.id))
+        self._voice_pool[guild.id] = (voice, expiry)
+        self._dbg(f"voice parked in guild {guild.id}")
+
+    async def _expire_pooled_voice(self, guild_id: int) -> None:
+        await asyncio.sleep(VOICE_POOL_IDLE_SECONDS)
+        pooled = self._voice_pool.pop(guild_id, None)
+        if pooled is None:
+            return
+        voice = pooled[0]
+        self._dbg(f"pooled voice expired in guild {guild_id}")
+        try:
+            await self._disconnect_voice(voice)
+        except Exception as e:
+            self._dbg(f"pooled voice disconnect failed: {e!r}")
+
+    async def _take_pooled_voice(self, guild_id: Optional[int]) -> Optional[discord.VoiceClient]:
+        # Only one voice connection can be live, so everything else is dropped.
+        keep = None
+        for gid, (voice, expiry) in list(self._voice_pool.items()):
+            if gid == guild_id and voice.is_connected():
+                self._voice_pool.pop(gid, None)
+                expiry.cancel()
+                keep = voice
+                continue
+            # Stay pooled (and on the expiry timer) until the disconnect has actually finished,
+            # so a cancelled drain cannot orphan a still-connected client.
+            try:
+                await self._disconnect_voice(voice)
+            except Exception as e:
+                self._dbg(f"pooled voice disconnect failed: {e!r}")
+            self._voice_pool.pop(gid, None)
+            expiry.cancel()
+        return keep
+
     async def _hold_connection(self, voice: discord.VoiceClient, label: str) -> None:
         print(f"Connected to {label}. Press Ctrl+C to disconnect.")
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        # remove_signal_handler() resets SIGINT to default_int_handler, not to whatever
+        # asyncio.run() installed, so remember the previous handler and put it back.
+        previous = signal.getsignal(signal.SIGINT)
         try:
-            while True:
-                await asyncio.sleep(1.0)
+            loop.add_signal_handler(signal.SIGINT, stop.set)
+            handler_installed = True
+        except (NotImplementedError, RuntimeError):
+            handler_installed = False
+        try:
+            await stop.wait()
+            print("Disconnecting...")
         except KeyboardInterrupt:
             print("Disconnecting...")
         finally:
-            await voice.disconnect(force=True)
+            if handler_installed:
+                loop.remove_signal_handler(signal.SIGINT)
+                if previous is not None:
+                    signal.signal(signal.SIGINT, previous)
+            await self._disconnect_voice(voice)
 
     async def _handle_connected_voice(self, voice: discord.VoiceClient, label: str) -> None:
         if self.args.command == "tui":
@@ -1551,104 +1890,137 @@ class VoiceSelfClient(discord.Client):
             if not cmd:
                 continue
 
-            parts = cmd.split()
-            head = parts[0].lower()
-
-            if head in ("help", "?"):
-                self._print_session_help()
-            elif head == "status":
-                self._print_session_status()
-            elif head == "dave":
-                await self._wait_for_dave_status(voice, timeout=max(0.5, self.args.dave_wait_timeout))
-            elif head == "mode":
-                if len(parts) < 2 or parts[1] not in ("file", "noise", "mic", "connect"):
-                    print("Usage: mode <file|noise|mic|connect>")
-                    continue
-                self.args.mode = parts[1]
-                await self._restart_playback(voice, label)
-            elif head == "file":
-                if len(parts) < 2:
-                    print("Usage: file <path>")
-                    continue
-                self.args.file = " ".join(parts[1:])
-                self.args.mode = "file"
-                await self._restart_playback(voice, label)
-            elif head == "loop":
-                if len(parts) < 2 or parts[1] not in ("on", "off"):
-                    print("Usage: loop <on|off>")
-                    continue
-                self.args.loop = parts[1] == "on"
-                if self.args.mode == "file":
-                    await self._restart_playback(voice, label)
-            elif head == "amp":
-                if len(parts) < 2:
-                    print("Usage: amp <0..1>")
-                    continue
-                try:
-                    self.args.noise_amp = float(parts[1])
-                except ValueError:
-                    print("Invalid amplitude.")
-                    continue
-                if self.args.mode == "noise":
-                    await self._restart_playback(voice, label)
-            elif head == "sources":
-                self._print_pulse_devices("sources")
-            elif head == "sinks":
-                self._print_pulse_devices("sinks")
-            elif head == "source":
-                if len(parts) < 2:
-                    print("Usage: source <pulse-source-name>")
-                    continue
-                self.args.pulse_source = " ".join(parts[1:])
-                self._set_default_pulse_device("source", self.args.pulse_source)
-                print(f"Pulse default source set to: {self.args.pulse_source}")
-                if self.args.mode == "mic":
-                    await self._restart_playback(voice, label)
-            elif head == "sink":
-                if len(parts) < 2:
-                    print("Usage: sink <pulse-sink-name>")
-                    continue
-                self.args.pulse_sink = " ".join(parts[1:])
-                self._set_default_pulse_device("sink", self.args.pulse_sink)
-                print(f"Pulse default sink set to: {self.args.pulse_sink}")
-            elif head == "restart":
-                await self._restart_playback(voice, label)
-            elif head == "switch":
-                print("Disconnecting and returning to target selection...")
-                if voice.is_playing():
-                    voice.stop()
-                await voice.disconnect(force=True)
-                return
-            elif head == "leave":
-                print("Disconnecting...")
-                if voice.is_playing():
-                    voice.stop()
-                await voice.disconnect(force=True)
-                return
-            elif head in ("quit", "exit"):
-                print("Disconnecting and exiting...")
-                if voice.is_playing():
-                    voice.stop()
-                await voice.disconnect(force=True)
-                raise SystemExit(0)
-            else:
+            # split(None, 1) accepts any whitespace separator but keeps runs of spaces in the argument.
+            head, *tail = cmd.split(None, 1)
+            head = head.lower()
+            rest = tail[0] if tail else ""
+            entry = self._session_cmds.get(head)
+            if entry is None:
                 print("Unknown command. Type 'help'.")
+                continue
+            needs_arg, usage, handler = entry
+            if needs_arg and not rest:
+                print(f"Usage: {usage}")
+                continue
+            if await handler(voice, label, rest):
+                return
+
+    async def _cmd_help(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        self._print_session_help()
+        return False
+
+    async def _cmd_status(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        self._print_session_status()
+        return False
+
+    async def _cmd_dave(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        await self._wait_for_dave_status(voice, timeout=max(0.5, self.args.dave_wait_timeout))
+        return False
+
+    async def _cmd_mode(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        arg = rest.split(None, 1)[0]
+        if arg not in ("file", "noise", "mic", "connect"):
+            print("Usage: mode <file|noise|mic|connect>")
+            return False
+        self.args.mode = arg
+        await self._restart_playback(voice, label)
+        return False
+
+    async def _cmd_file(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        self.args.file = rest
+        self.args.mode = "file"
+        await self._restart_playback(voice, label)
+        return False
+
+    async def _cmd_loop(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        arg = rest.split(None, 1)[0]
+        if arg not in ("on", "off"):
+            print("Usage: loop <on|off>")
+            return False
+        self.args.loop = arg == "on"
+        if self.args.mode == "file":
+            await self._restart_playback(voice, label)
+        return False
+
+    async def _cmd_amp(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        try:
+            self.args.noise_amp = float(rest.split(None, 1)[0])
+        except ValueError:
+            print("Invalid amplitude.")
+            return False
+        if self.args.mode == "noise":
+            await self._restart_playback(voice, label)
+        return False
+
+    async def _cmd_sources(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        await self._print_pulse_devices("sources")
+        return False
+
+    async def _cmd_sinks(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        await self._print_pulse_devices("sinks")
+        return False
+
+    async def _cmd_source(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        self.args.pulse_source = rest
+        await self._set_default_pulse_device("source", self.args.pulse_source)
+        print(f"Pulse default source set to: {self.args.pulse_source}")
+        if self.args.mode == "mic":
+            await self._restart_playback(voice, label)
+        return False
+
+    async def _cmd_sink(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        self.args.pulse_sink = rest
+        await self._set_default_pulse_device("sink", self.args.pulse_sink)
+        print(f"Pulse default sink set to: {self.args.pulse_sink}")
+        return False
+
+    async def _cmd_restart(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        await self._restart_playback(voice, label)
+        return False
+
+    async def _cmd_switch(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        print("Disconnecting and returning to target selection...")
+        await self._disconnect_voice(voice)
+        return True
+
+    async def _cmd_leave(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        print("Disconnecting...")
+        await self._disconnect_voice(voice)
+        return True
+
+    async def _cmd_quit(self, voice: discord.VoiceClient, label: str, rest: str) -> bool:
+        print("Disconnecting and exiting...")
+        await self._disconnect_voice(voice)
+        raise SystemExit(0)
 
     async def _restart_playback(self, voice: discord.VoiceClient, label: str) -> None:
         if voice.is_playing():
+            done = self._play_done
             voice.stop()
-            await asyncio.sleep(0.05)
+            if done is not None:
+                try:
+                    await asyncio.wait_for(done.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    self._dbg("playback teardown did not signal within 1s")
 
         if self.args.mode == "connect":
             print(f"Connected to {label} (no audio playback).")
             self._dbg(f"connect-only mode in {label}")
             return
 
-        ffmpeg = self.args.ffmpeg_path or shutil.which("ffmpeg")
+        ffmpeg = self._resolve_ffmpeg()
         if ffmpeg is None:
             raise RuntimeError("ffmpeg not found. Install ffmpeg or pass --ffmpeg-path")
-        source = self._make_audio_source(ffmpeg)
-        voice.play(source, after=lambda err: print(f"Playback error: {err}") if err else None)
+        source = await asyncio.to_thread(self._make_audio_source, ffmpeg)
+        loop = asyncio.get_running_loop()
+        done = self._play_done = asyncio.Event()
+
+        def after_play(err: Optional[Exception]):
+            if err:
+                print(f"Playback error: {err}")
+            loop.call_soon_threadsafe(done.set)
+
+        voice.play(source, after=after_play)
         if self.args.mode == "file":
             print(f"Now playing file (loop={self.args.loop}): {self.args.file}")
             self._dbg(f"playing file: {self.args.file} loop={self.args.loop}")
@@ -1659,55 +2031,65 @@ class VoiceSelfClient(discord.Client):
             print(f"Now streaming microphone source: {self.args.pulse_source or 'default'}")
             self._dbg(f"streaming mic: source={self.args.pulse_source or 'default'}")
 
+    _SESSION_HELP = "\n".join(
+        [
+            "Commands:",
+            "  help                 show this help",
+            "  status               show current playback/device settings",
+            "  dave                 print current DAVE status",
+            "  mode <file|noise|mic|connect>",
+            "  file <path>          set file path and switch to file mode",
+            "  loop <on|off>        toggle file looping",
+            "  amp <0..1>           set noise amplitude",
+            "  sources              list PulseAudio sources",
+            "  sinks                list PulseAudio sinks",
+            "  source <name>        set PulseAudio source (for mic mode)",
+            "  sink <name>          set PulseAudio sink",
+            "  restart              restart current playback mode",
+            "  switch               disconnect and select another target",
+            "  leave                disconnect and return to menu",
+            "  quit                 disconnect and exit app",
+        ]
+    )
+
     def _print_session_help(self) -> None:
-        print("Commands:")
-        print("  help                 show this help")
-        print("  status               show current playback/device settings")
-        print("  dave                 print current DAVE status")
-        print("  mode <file|noise|mic|connect>")
-        print("  file <path>          set file path and switch to file mode")
-        print("  loop <on|off>        toggle file looping")
-        print("  amp <0..1>           set noise amplitude")
-        print("  sources              list PulseAudio sources")
-        print("  sinks                list PulseAudio sinks")
-        print("  source <name>        set PulseAudio source (for mic mode)")
-        print("  sink <name>          set PulseAudio sink")
-        print("  restart              restart current playback mode")
-        print("  switch               disconnect and select another target")
-        print("  leave                disconnect and return to menu")
-        print("  quit                 disconnect and exit app")
+        sys.stdout.write(self._SESSION_HELP + "\n")
+        sys.stdout.flush()
 
     def _print_session_status(self) -> None:
-        print(
-            "Status:",
-            f"mode={self.args.mode}",
-            f"file={self.args.file}",
-            f"loop={self.args.loop}",
-            f"noise_amp={self.args.noise_amp}",
-            f"pulse_source={self.args.pulse_source or 'default'}",
-            f"pulse_sink={self.args.pulse_sink or '(unchanged)'}",
+        sys.stdout.write(
+            "Status: "
+            f"mode={self.args.mode} "
+            f"file={self.args.file} "
+            f"loop={self.args.loop} "
+            f"noise_amp={self.args.noise_amp} "
+            f"pulse_source={self.args.pulse_source or 'default'} "
+            f"pulse_sink={self.args.pulse_sink or '(unchanged)'}\n"
         )
+        sys.stdout.flush()
 
     def _select_menu(self, title: str, items: list[str]) -> int:
-        print(f"\n{title}:")
-        for i, item in enumerate(items, start=1):
-            print(f"  {i}. {item}")
+        buf = [f"\n{title}:"]
+        buf.extend(f"  {i}. {item}" for i, item in enumerate(items, start=1))
+        sys.stdout.write("\n".join(buf) + "\n")
+        sys.stdout.flush()
         while True:
-            raw = input("> ").strip()
-            if raw.isdigit():
-                idx = int(raw) - 1
+            try:
+                idx = int(input("> ")) - 1
                 if 0 <= idx < len(items):
                     return idx
+            except ValueError:
+                pass
             print("Invalid selection. Enter a number from the list.")
 
     def _prompt_int(self, label: str) -> int:
         while True:
-            raw = input(f"{label}: ").strip()
-            if raw.isdigit():
-                return int(raw)
-            print("Invalid number.")
+            try:
+                return int(input(f"{label}: "))
+            except ValueError:
+                print("Invalid number.")
 
-    def _tui_configure_audio(self) -> None:
+    async def _tui_configure_audio(self) -> None:
         print("\nAudio setup:")
         mode_idx = self._select_menu("Select audio mode", ["File", "Noise", "Microphone", "Connect only"])
         if mode_idx == 0:
@@ -1729,34 +2111,117 @@ class VoiceSelfClient(discord.Client):
         elif mode_idx == 2:
             self.args.mode = "mic"
             self.args.loop = False
-            self.args.pulse_source = self._select_pulse_device("sources", "input source", self.args.pulse_source)
+            self.args.pulse_source = await self._select_pulse_device("sources", "input source", self.args.pulse_source)
         else:
             self.args.mode = "connect"
             self.args.loop = False
 
         sink_idx = self._select_menu("Set PulseAudio output sink?", ["Keep current", "Choose sink"])
         if sink_idx == 1:
-            sink = self._select_pulse_device("sinks", "output sink", self.args.pulse_sink)
+            sink = await self._select_pulse_device("sinks", "output sink", self.args.pulse_sink)
             if sink:
                 self.args.pulse_sink = sink
-                self._set_default_pulse_device("sink", sink)
+                await self._set_default_pulse_device("sink", sink)
                 print(f"Pulse default sink set to: {sink}")
 
         if self.args.mode == "mic" and self.args.pulse_source:
-            self._set_default_pulse_device("source", self.args.pulse_source)
+            await self._set_default_pulse_device("source", self.args.pulse_source)
             print(f"Pulse default source set to: {self.args.pulse_source}")
 
-    def _pulse_device_entries(self, kind: str) -> list[tuple[str, str]]:
+    async def _pactl_output(self, *args: str) -> Optional[str]:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "pactl",
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            out, _ = await proc.communicate()
+        except Exception:
+            return None
+        if proc.returncode != 0:
+            return None
+        return out.decode("utf-8", errors="replace")
+
+    async def _pactl_lines(self, *args: str) -> AsyncIterator[str]:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "pactl",
+                *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=PACTL_LINE_LIMIT,
+            )
+        except Exception:
+            return
+        try:
+            async for raw in proc.stdout:
+                yield raw.decode("utf-8", errors="replace")
+        except ValueError as e:
+            # A line still longer than the limit: keep what was parsed so far rather than fail the listing.
+            self._dbg(f"pactl {' '.join(args)}: output line too long, truncating: {e}")
+        finally:
+            if proc.returncode is None and not proc.stdout.at_eof():
+                proc.kill()
+            await proc.wait()
+
+    async def _pulse_device_entries(self, kind: str) -> list[tuple[str, str]]:
         if kind not in ("sources", "sinks"):
             return []
+        now = time.monotonic()
+        cached = self._pulse_cache.get(kind)
+        if cached is not None and (now - cached[0]) < PULSE_CACHE_TTL_SECONDS:
+            self._dbg(f"pactl {kind}: cache hit")
+            return cached[1]
+        entries = await self._query_pulse_device_entries(kind)
+        self._pulse_cache[kind] = (now, entries)
+        return entries
+
+    def _invalidate_pulse_cache(self) -> None:
+        self._pulse_cache.clear()
+
+    def _drop_pulse_client(self) -> None:
+        if self._pulse is None:
+            return
         try:
-            out = subprocess.check_output(["pactl", "list", kind], text=True, stderr=subprocess.DEVNULL)
+            self._pulse.close()
         except Exception:
-            return self._pulse_device_entries_short(kind)
+            pass
+        self._pulse = None
+
+    async def _pulsectl_call(self, method: str, *args: Any) -> Any:
+        # pulsectl.Pulse is synchronous and not thread-safe: serialize calls and keep them off the loop.
+        def call():
+            if self._pulse is None:
+                self._pulse = pulsectl.Pulse("shitcord-voice")
+            return getattr(self._pulse, method)(*args)
+
+        async with self._pulse_lock:
+            try:
+                return await asyncio.to_thread(call)
+            except Exception:
+                self._drop_pulse_client()
+                raise
+
+    async def _query_pulse_device_entries(self, kind: str) -> list[tuple[str, str]]:
+        if pulsectl is not None:
+            try:
+                devices = await self._pulsectl_call("source_list" if kind == "sources" else "sink_list")
+            except Exception as e:
+                self._dbg(f"pulsectl {kind} failed, using pactl: {e!r}")
+            else:
+                seen_names = set()
+                listed: list[tuple[str, str]] = []
+                for dev in devices:
+                    if dev.name in seen_names:
+                        continue
+                    seen_names.add(dev.name)
+                    listed.append((dev.name, dev.description or dev.name))
+                return listed
         entries: list[tuple[str, str]] = []
         current_name: Optional[str] = None
         current_desc: Optional[str] = None
-        for raw in out.splitlines():
+        async for raw in self._pactl_lines("list", kind):
             line = raw.strip()
             if line.startswith(("Source #", "Sink #")):
                 if current_name:
@@ -1783,17 +2248,13 @@ class VoiceSelfClient(discord.Client):
             deduped.append((name, desc))
         if deduped:
             return deduped
-        return self._pulse_device_entries_short(kind)
+        return await self._pulse_device_entries_short(kind)
 
-    def _pulse_device_entries_short(self, kind: str) -> list[tuple[str, str]]:
-        try:
-            out = subprocess.check_output(["pactl", "list", "short", kind], text=True, stderr=subprocess.DEVNULL)
-        except Exception:
-            return []
+    async def _pulse_device_entries_short(self, kind: str) -> list[tuple[str, str]]:
         entries: list[tuple[str, str]] = []
         seen = set()
-        for line in out.splitlines():
-            parts = line.split("\t")
+        async for line in self._pactl_lines("list", "short", kind):
+            parts = line.split("\t", 2)
             if len(parts) >= 2:
                 name = parts[1].strip()
                 if name in seen:
@@ -1802,11 +2263,11 @@ class VoiceSelfClient(discord.Client):
                 entries.append((name, name))
         return entries
 
-    def _pulse_devices(self, kind: str) -> list[str]:
-        return [name for name, _ in self._pulse_device_entries(kind)]
+    async def _pulse_devices(self, kind: str) -> list[str]:
+        return [name for name, _ in await self._pulse_device_entries(kind)]
 
-    def _select_pulse_device(self, kind: str, label: str, current: Optional[str]) -> Optional[str]:
-        entries = self._pulse_device_entries(kind)
+    async def _select_pulse_device(self, kind: str, label: str, current: Optional[str]) -> Optional[str]:
+        entries = await self._pulse_device_entries(kind)
         if not entries:
             manual = input(f"No PulseAudio {label}s found. Enter {label} name manually (blank to skip): ").strip()
             return manual or current
@@ -1824,12 +2285,19 @@ class VoiceSelfClient(discord.Client):
             return current
         return entries[idx][0]
 
-    def _set_default_pulse_device(self, kind: str, name: str) -> None:
-        cmd = ["pactl", f"set-default-{kind}", name]
-        subprocess.run(cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    async def _set_default_pulse_device(self, kind: str, name: str) -> None:
+        if pulsectl is not None:
+            try:
+                await self._pulsectl_call(f"{kind}_default_set", name)
+            except Exception as e:
+                self._dbg(f"pulsectl set-default-{kind} failed, using pactl: {e!r}")
+                await self._pactl_output(f"set-default-{kind}", name)
+        else:
+            await self._pactl_output(f"set-default-{kind}", name)
+        self._invalidate_pulse_cache()
 
-    def _print_pulse_devices(self, kind: str) -> None:
-        entries = self._pulse_device_entries(kind)
+    async def _print_pulse_devices(self, kind: str) -> None:
+        entries = await self._pulse_device_entries(kind)
         if not entries:
             print(f"No PulseAudio {kind} found.")
             return
@@ -1837,15 +2305,52 @@ class VoiceSelfClient(discord.Client):
         for name, desc in entries:
             print(f"  - {desc} [{name}]")
 
-    async def _wait_for_dave_status(self, voice: discord.VoiceClient, *, timeout: float) -> None:
+    def _ensure_dave_poller(self, voice: discord.VoiceClient, timeout: float) -> asyncio.Event:
+        # One poller per voice client; every caller waits on the same event.
+        # The poller runs until the latest waiter's timeout, not for the whole call.
         deadline = asyncio.get_running_loop().time() + timeout
-        while True:
+        self._dave_deadline = max(self._dave_deadline, deadline)
+        task = self._dave_task
+        if self._dave_voice is not voice or task is None or (task.done() and not self._dave_event.is_set()):
+            if task is not None and not task.done():
+                task.cancel()
+            self._dave_voice = voice
+            self._dave_deadline = deadline
+            self._dave_event = asyncio.Event()
+            self._attach_voice_ws_hook(voice)
+            self._dave_task = asyncio.create_task(self._poll_dave(voice, self._dave_event))
+        return self._dave_event
+
+    def _check_dave_ready(self) -> None:
+        # DAVE handshakes progress via voice gateway messages, so re-check readiness as each one lands.
+        voice = self._dave_voice
+        if voice is None or self._dave_event.is_set():
+            return
+        conn = getattr(voice, "_connection", None)
+        if conn is not None and getattr(conn, "can_encrypt", False):
+            self._dave_event.set()
+
+    async def _poll_dave(self, voice: discord.VoiceClient, ready: asyncio.Event) -> None:
+        loop = asyncio.get_running_loop()
+        delay = 0.02
+        while voice.is_connected() and loop.time() < self._dave_deadline:
             conn = getattr(voice, "_connection", None)
-            can_encrypt = bool(getattr(conn, "can_encrypt", False)) if conn else False
-            now = asyncio.get_running_loop().time()
-            if can_encrypt or now >= deadline:
-                break
-            await asyncio.sleep(0.5)
+            if conn is not None:
+                if getattr(conn, "can_encrypt", False):
+                    ready.set()
+                    return
+                if getattr(conn, "dave_protocol_version", None) == 0:
+                    # No DAVE negotiated; a later transition is picked up by the voice ws hook.
+                    return
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.6, 0.2)
+
+    async def _wait_for_dave_status(self, voice: discord.VoiceClient, *, timeout: float) -> None:
+        ready = self._ensure_dave_poller(voice, timeout)
+        try:
+            await asyncio.wait_for(ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
 
         conn = getattr(voice, "_connection", None)
         if conn is None:
@@ -1880,6 +2385,11 @@ class VoiceSelfClient(discord.Client):
                 f"DAVE required but not active (active_protocol={active_proto}, can_encrypt={can_encrypt})"
             )
 
+    def _resolve_ffmpeg(self) -> Optional[str]:
+        if self._ffmpeg_path is None:
+            self._ffmpeg_path = getattr(self.args, "ffmpeg_path", None) or shutil.which("ffmpeg")
+        return self._ffmpeg_path
+
     def _ffmpeg_demuxers(self, ffmpeg: str) -> set[str]:
         cached = self._ffmpeg_demuxers_cache.get(ffmpeg)
         if cached is not None:
@@ -1928,8 +2438,14 @@ class VoiceSelfClient(discord.Client):
 
     def _make_audio_source(self, ffmpeg: str) -> discord.AudioSource:
         if self.args.mode == "file":
-            if not os.path.exists(self.args.file):
-                raise RuntimeError(f"Audio file not found: {self.args.file}")
+            cached = self._file_stat_cache
+            if cached is None or cached[0] != self.args.file:
+                try:
+                    st = os.stat(self.args.file)
+                except OSError:
+                    raise RuntimeError(f"Audio file not found: {self.args.file}") from None
+                self._file_stat_cache = (self.args.file, st)
+                self._dbg(f"audio file: {self.args.file} size={st.st_size} mtime={int(st.st_mtime)}")
             return discord.FFmpegPCMAudio(
                 source=self.args.file,
                 executable=ffmpeg,
@@ -1959,12 +2475,12 @@ class VoiceSelfClient(discord.Client):
         )
 
     async def _play_to_voice_client(self, voice: discord.VoiceClient, label: str) -> None:
-        ffmpeg = self.args.ffmpeg_path or shutil.which("ffmpeg")
+        ffmpeg = self._resolve_ffmpeg()
         if ffmpeg is None:
             await voice.disconnect(force=True)
             raise RuntimeError("ffmpeg not found. Install ffmpeg or pass --ffmpeg-path")
 
-        source = self._make_audio_source(ffmpeg)
+        source = await asyncio.to_thread(self._make_audio_source, ffmpeg)
         if self.args.mode == "file":
             print(f"Playing file to {label} (loop={self.args.loop}): {self.args.file}")
         elif self.args.mode == "mic":
@@ -1982,20 +2498,12 @@ class VoiceSelfClient(discord.Client):
         voice.play(source, after=after_play)
 
         try:
-            if self.args.loop and self.args.mode == "file":
-                while True:
-                    await finished.wait()
-                    finished.clear()
-                    source = self._make_audio_source(ffmpeg)
-                    voice.play(source, after=after_play)
-            else:
-                await finished.wait()
+            # File loop mode uses ffmpeg's -stream_loop -1, so the source only ends on error.
+            await finished.wait()
         except KeyboardInterrupt:
             print("Interrupted")
         finally:
-            if voice.is_playing():
-                voice.stop()
-            await voice.disconnect(force=True)
+            await self._disconnect_voice(voice)
 
 
 async def _run(args: argparse.Namespace) -> None:
@@ -2004,30 +2512,48 @@ async def _run(args: argparse.Namespace) -> None:
     if not token:
         raise RuntimeError("Token is required (--token, config file, or DISCORD_USER_TOKEN)")
 
+    if sys.version_info >= (3, 11):
+        # A failing client.start() (bad token, gateway error) cancels the wait
+        # instead of leaving it blocked on an event nothing will set.
+        shutting_down = False
+        try:
+            async with asyncio.TaskGroup() as tg:
+                runner = tg.create_task(client.start(token))
+                await client._done.wait()
+                shutting_down = True
+                await client.close()
+                await asyncio.wait((runner,), timeout=0.2)
+                runner.cancel()
+        except ExceptionGroup as eg:
+            rest: Optional[BaseException] = eg
+            if shutting_down and not runner.cancelled() and runner.exception() is not None:
+                # Only the runner erroring out while the client is torn down is expected.
+                runner_exc = runner.exception()
+                _, rest = eg.split(lambda exc: exc is runner_exc)
+            if rest is not None:
+                if len(rest.exceptions) == 1:
+                    raise rest.exceptions[0] from rest
+                raise rest
+        return
+
     runner = asyncio.create_task(client.start(token))
     await client._done.wait()
     await client.close()
-    await asyncio.sleep(0.2)
-    if not runner.done():
+    try:
+        await asyncio.wait_for(asyncio.shield(runner), timeout=0.2)
+    except asyncio.TimeoutError:
         runner.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await runner
+    except Exception:
+        pass
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="shitcord-voice+video")
-    parser.add_argument("--config", default=DEFAULT_CONFIG_PATH, help=f"Path to local config json (default: {DEFAULT_CONFIG_PATH})")
-    parser.add_argument("--token", help="Discord user token (or set DISCORD_USER_TOKEN)")
-    parser.add_argument("--log-file", default=None, help="Append debug/errors to this file")
-    parser.add_argument("--safe-disable", action="store_true", help="Disable built-in safety throttles (not recommended)")
-    parser.add_argument("--safe-connect-min-interval", type=float, default=5.0, help="Minimum seconds between voice connect attempts")
-    parser.add_argument("--safe-same-target-cooldown", type=float, default=15.0, help="Minimum seconds before reconnecting same DM/VC target")
-    parser.add_argument("--safe-max-connects-10m", type=int, default=30, help="Max voice connect attempts allowed per 10 minutes")
-    parser.add_argument("--safe-max-rings-10m", type=int, default=10, help="Max DM ring attempts allowed per 10 minutes")
-    parser.add_argument("--safe-max-fetch-user-1m", type=int, default=30, help="Max user fetch requests allowed per minute")
-
-    sub = parser.add_subparsers(dest="command", required=True)
-
+def _setup_list(sub: argparse._SubParsersAction) -> None:
     sub.add_parser("list", help="List guilds and voice channels")
 
+
+def _setup_play(sub: argparse._SubParsersAction) -> None:
     play = sub.add_parser("play", help="Join voice channel and play audio")
     play.add_argument("--guild-id", type=int, required=False)
     play.add_argument("--channel-id", type=int, required=False)
@@ -2042,6 +2568,8 @@ def parse_args() -> argparse.Namespace:
     play.add_argument("--require-dave", action="store_true", help="Abort if DAVE is not active/encrypting")
     play.add_argument("--dave-wait-timeout", type=float, default=10.0, help="Seconds to wait for DAVE encryption readiness")
 
+
+def _setup_dm_play(sub: argparse._SubParsersAction) -> None:
     dm_play = sub.add_parser("dm-play", help="Start/join DM call and play audio")
     dm_play.add_argument("--user-id", type=int, required=False, help="Target user id for DM call")
     dm_play.add_argument("--ring", action="store_true", help="Ring user when starting DM call")
@@ -2057,6 +2585,8 @@ def parse_args() -> argparse.Namespace:
     dm_play.add_argument("--require-dave", action="store_true", help="Abort if DAVE is not active/encrypting")
     dm_play.add_argument("--dave-wait-timeout", type=float, default=10.0, help="Seconds to wait for DAVE encryption readiness")
 
+
+def _setup_tui(sub: argparse._SubParsersAction) -> None:
     tui = sub.add_parser("tui", help="Interactive terminal UI for DM/Guild voice connect")
     tui.add_argument("--ring", action="store_true", help="Ring user when starting DM call")
     tui.add_argument("--file", default="rickroll.ogg", help="Default file path in TUI file mode")
@@ -2069,6 +2599,8 @@ def parse_args() -> argparse.Namespace:
     tui.add_argument("--require-dave", action="store_true", help="Abort if DAVE is not active/encrypting")
     tui.add_argument("--dave-wait-timeout", type=float, default=10.0, help="Seconds to wait for DAVE encryption readiness")
 
+
+def _setup_ctui(sub: argparse._SubParsersAction) -> None:
     ctui = sub.add_parser("ctui", help="Curses full-screen TUI for DM/Guild connect and live control")
     ctui.add_argument("--ring", action="store_true", help="Ring user when starting DM call")
     ctui.add_argument("--file", default="rickroll.ogg", help="Default file path in Curses TUI")
@@ -2089,46 +2621,88 @@ def parse_args() -> argparse.Namespace:
     ctui.add_argument("--start-guild-id", type=int, default=None, help="Auto-connect to this guild at CTUI startup")
     ctui.add_argument("--start-channel-id", type=int, default=None, help="Auto-connect to this voice channel at CTUI startup")
 
+
+_SUBCOMMAND_SETUP: dict[str, Callable[[argparse._SubParsersAction], None]] = {
+    "list": _setup_list,
+    "play": _setup_play,
+    "dm-play": _setup_dm_play,
+    "tui": _setup_tui,
+    "ctui": _setup_ctui,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="shitcord-voice+video")
+    parser.add_argument("--config", default=DEFAULT_CONFIG_PATH, help=f"Path to local config json (default: {DEFAULT_CONFIG_PATH})")
+    parser.add_argument("--token", help="Discord user token (or set DISCORD_USER_TOKEN)")
+    parser.add_argument("--log-file", default=None, help="Append debug/errors to this file")
+    parser.add_argument("--safe-disable", action="store_true", help="Disable built-in safety throttles (not recommended)")
+    parser.add_argument("--safe-connect-min-interval", type=float, default=5.0, help="Minimum seconds between voice connect attempts")
+    parser.add_argument("--safe-same-target-cooldown", type=float, default=15.0, help="Minimum seconds before reconnecting same DM/VC target")
+    parser.add_argument("--safe-max-connects-10m", type=int, default=30, help="Max voice connect attempts allowed per 10 minutes")
+    parser.add_argument("--safe-max-rings-10m", type=int, default=10, help="Max DM ring attempts allowed per 10 minutes")
+    parser.add_argument("--safe-max-fetch-user-1m", type=int, default=30, help="Max user fetch requests allowed per minute")
+
+    # Only build the subparser that is actually used; --help and a missing or
+    # unknown command still get the full set so usage/errors list every choice.
+    argv = sys.argv[1:]
+    command = None
+    if "-h" not in argv and "--help" not in argv:
+        _, rest = parser.parse_known_args(argv)
+        command = next((a for a in rest if a in _SUBCOMMAND_SETUP), None)
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    if command is None:
+        for setup in _SUBCOMMAND_SETUP.values():
+            setup(sub)
+    else:
+        _SUBCOMMAND_SETUP[command](sub)
+
     args = parser.parse_args()
     cfg = load_local_config(args.config)
     args.config_token = cfg.get("token")
+    ns = vars(args)
 
     # Ensure interactive commands always have a full audio state.
     # ctui/tui menus mutate these, but status rendering may read them first.
     if args.command in ("tui", "ctui"):
-        if not hasattr(args, "mode"):
-            args.mode = "connect"
-        if not hasattr(args, "loop"):
-            args.loop = False
-        if not hasattr(args, "noise_amp"):
-            args.noise_amp = 0.08
-        if not hasattr(args, "file"):
-            args.file = "rickroll.ogg"
-        if not hasattr(args, "pulse_source"):
-            args.pulse_source = None
-        if not hasattr(args, "pulse_sink"):
-            args.pulse_sink = None
+        for attr, value in INTERACTIVE_AUDIO_DEFAULTS.items():
+            ns.setdefault(attr, value)
+
+    # Fill target ids the subcommand defines but the user left unset from the config file.
+    for attr, key in CONFIG_ARG_KEYS.items():
+        if attr in ns and ns[attr] is None:
+            ns[attr] = cfg.get(key)
 
     if args.command == "play":
-        if args.guild_id is None:
-            args.guild_id = cfg.get("guild_id")
-        if args.channel_id is None:
-            args.channel_id = cfg.get("channel_id")
         if args.guild_id is None or args.channel_id is None:
             raise SystemExit("play requires --guild-id and --channel-id (or set them in config)")
     elif args.command == "dm-play":
-        if args.user_id is None:
-            args.user_id = cfg.get("dm_user_id")
         if args.user_id is None:
             raise SystemExit("dm-play requires --user-id (or set dm_user_id in config)")
 
     return args
 
 
+def _event_loop_kwargs() -> dict[str, Any]:
+    if sys.platform == "win32":
+        return {}  # ProactorEventLoop is already the default there.
+    try:
+        import uvloop
+    except ImportError:
+        return {}
+    if sys.version_info >= (3, 12):
+        return {"loop_factory": uvloop.new_event_loop}
+    # Event loop policies are deprecated from 3.14; only older interpreters go this way.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return {}
+
+
 def main() -> int:
     args = parse_args()
+    loop_kwargs = _event_loop_kwargs()
     try:
-        asyncio.run(_run(args))
+        asyncio.run(_run(args), **loop_kwargs)
         return 0
     except Exception as exc:  # pylint: disable=broad-except
         if args.log_file: